@@ -115,6 +115,7 @@ class MySQLConnector(SQLAlchemyConnector):
         table_type: TABLE_TYPE = "table",
         catalog_name: str = "",
         database_name: str = "",
+        tables: Optional[List[str]] = None,
     ) -> List[Dict[str, str]]:
         """
         Get metadata for tables/views from INFORMATION_SCHEMA.
@@ -123,6 +124,7 @@ class MySQLConnector(SQLAlchemyConnector):
             table_type: Type of object (table, view, mv)
             catalog_name: Catalog name (unused in MySQL)
             database_name: Database name to query
+            tables: Optional list of table names to restrict the query to
 
         Returns:
             List of metadata dictionaries
@@ -139,21 +141,21 @@ class MySQLConnector(SQLAlchemyConnector):
         # Get metadata configuration
         metadata_config = _get_metadata_config(table_type)
 
-        # Build and execute query
+        # Build and execute query, restricting to the requested tables so
+        # callers with a filter don't pull metadata for the whole database
         type_filter = list_to_in_str("and TABLE_TYPE in ", metadata_config.table_types)
+        name_filter = list_to_in_str("and TABLE_NAME in ", tables) if tables else ""
         query = (
             f"SELECT TABLE_SCHEMA, TABLE_NAME "
             f"FROM information_schema.{metadata_config.info_table} "
-            f"WHERE {where} {type_filter}"
+            f"WHERE {where} {type_filter} {name_filter}"
         )
 
         query_result = self._execute_pandas(query)
 
-        # Format results
+        # Format results; itertuples avoids a pandas scalar lookup per cell
         result = []
-        for i in range(len(query_result)):
-            db_name = query_result["TABLE_SCHEMA"][i]
-            tb_name = query_result["TABLE_NAME"][i]
+        for db_name, tb_name in query_result.itertuples(index=False):
             result.append(
                 {
                     "identifier": self.identifier(database_name=db_name, table_name=tb_name),
@@ -206,7 +208,7 @@ class MySQLConnector(SQLAlchemyConnector):
         filter_tables = self._reset_filter_tables(tables, catalog_name, database_name)
         metadata_config = _get_metadata_config(table_type)
 
-        for meta in self._get_metadata(table_type, catalog_name, database_name):
+        for meta in self._get_metadata(table_type, catalog_name, database_name, tables=tables):
             full_name = self.full_name(database_name=meta["database_name"], table_name=meta["table_name"])
 
             # Skip if not in filter list
@@ -281,17 +283,18 @@ class MySQLConnector(SQLAlchemyConnector):
         """
         query_result = self._execute_pandas(sql)
 
+        # itertuples avoids a pandas scalar lookup per cell
         result = []
-        for i in range(len(query_result)):
+        for i, row in enumerate(query_result.itertuples(index=False)):
             result.append(
                 {
                     "cid": i,
-                    "name": query_result["Field"][i],
-                    "type": query_result["Type"][i],
-                    "nullable": query_result["Null"][i] == "YES",
-                    "default_value": query_result["Default"][i],
-                    "pk": query_result["Key"][i] == "PRI",
-                    "comment": query_result["Comment"][i],
+                    "name": row.Field,
+                    "type": row.Type,
+                    "nullable": row.Null == "YES",
+                    "default_value": row.Default,
+                    "pk": row.Key == "PRI",
+                    "comment": row.Comment,
                 }
             )
         return result
@@ -317,8 +320,13 @@ class MySQLConnector(SQLAlchemyConnector):
 
     @override
     def do_switch_context(self, catalog_name: str = "", database_name: str = "", schema_name: str = ""):
-        """Switch database context using USE statement."""
-        if database_name:
+        """Switch database context using USE statement.
+
+        Switching to the database we are already in is a no-op, so callers
+        that defensively re-assert their context before DDL don't pay a
+        roundtrip for it.
+        """
+        if database_name and database_name != self.database_name:
             with self.engine.connect() as conn:
                 conn.execute(text(f"USE {self._quote_identifier(database_name)}"))
             self.database_name = database_name
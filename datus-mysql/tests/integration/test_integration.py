@@ -3,7 +3,7 @@
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 
 import os
-import uuid
+import secrets
 
 import pytest
 from datus_mysql import MySQLConfig, MySQLConnector
@@ -77,7 +77,7 @@ def test_get_tables(connector: MySQLConnector, config: MySQLConfig):
 def test_get_tables_with_ddl(connector: MySQLConnector, config: MySQLConfig):
     """Test getting tables with DDL."""
     # Create a test table first
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"test_table_{suffix}"
 
     connector.switch_context(database_name=config.database)
@@ -119,7 +119,7 @@ def test_get_views(connector: MySQLConnector, config: MySQLConfig):
 def test_get_views_with_ddl(connector: MySQLConnector, config: MySQLConfig):
     """Test getting views with DDL."""
     # Create a test view first
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     view_name = f"test_view_{suffix}"
     table_name = f"test_table_{suffix}"
 
@@ -147,8 +147,13 @@ def test_get_views_with_ddl(connector: MySQLConnector, config: MySQLConfig):
                 assert "definition" in view[0]
                 assert view[0]["table_type"] == "view"
     finally:
-        connector.execute_ddl(f"DROP VIEW IF EXISTS {view_name}")
-        connector.execute_ddl(f"DROP TABLE IF EXISTS {table_name}")
+        # Drop both objects over a single connection checkout/commit
+        connector.execute_queries(
+            [
+                f"DROP VIEW IF EXISTS {view_name}",
+                f"DROP TABLE IF EXISTS {table_name}",
+            ]
+        )
 
 
 # ==================== Schema Tests ====================
@@ -158,7 +163,7 @@ def test_get_views_with_ddl(connector: MySQLConnector, config: MySQLConfig):
 @pytest.mark.acceptance
 def test_get_schema(connector: MySQLConnector, config: MySQLConfig):
     """Test getting table schema."""
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"test_schema_{suffix}"
 
     connector.switch_context(database_name=config.database)
@@ -178,13 +183,16 @@ def test_get_schema(connector: MySQLConnector, config: MySQLConfig):
 
         assert len(schema) == 4
 
+        # Index columns by name instead of scanning the list per lookup
+        columns = {col["name"]: col for col in schema}
+
         # Check id column
-        id_col = [col for col in schema if col["name"] == "id"][0]
+        id_col = columns["id"]
         assert id_col["pk"] is True
         assert "int" in id_col["type"].lower()
 
         # Check name column
-        name_col = [col for col in schema if col["name"] == "name"][0]
+        name_col = columns["name"]
         assert name_col["nullable"] is False
         assert "varchar" in name_col["type"].lower()
     finally:
@@ -197,27 +205,27 @@ def test_get_schema(connector: MySQLConnector, config: MySQLConfig):
 @pytest.mark.integration
 def test_get_sample_rows(connector: MySQLConnector, config: MySQLConfig):
     """Test getting sample rows."""
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"test_sample_{suffix}"
 
     connector.switch_context(database_name=config.database)
-    connector.execute_ddl(
-        f"""
+
+    # Create the table and seed it over a single connection checkout/commit
+    connector.execute_queries(
+        [
+            f"""
         CREATE TABLE IF NOT EXISTS {table_name} (
             id INT PRIMARY KEY,
             name VARCHAR(50)
         )
-    """
-    )
-
-    # Insert test data
-    connector.execute_insert(
-        f"""
+    """,
+            f"""
         INSERT INTO {table_name} (id, name) VALUES
         (1, 'Alice'),
         (2, 'Bob'),
         (3, 'Charlie')
-    """
+    """,
+        ]
     )
 
     try:
@@ -247,7 +255,7 @@ def test_execute_select(connector: MySQLConnector):
 @pytest.mark.acceptance
 def test_execute_ddl(connector: MySQLConnector, config: MySQLConfig):
     """Test DDL operations."""
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"test_ddl_{suffix}"
 
     connector.switch_context(database_name=config.database)
@@ -275,7 +283,7 @@ def test_execute_ddl(connector: MySQLConnector, config: MySQLConfig):
 @pytest.mark.integration
 def test_execute_insert(connector: MySQLConnector, config: MySQLConfig):
     """Test INSERT operation."""
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"test_insert_{suffix}"
 
     connector.switch_context(database_name=config.database)
@@ -305,7 +313,7 @@ def test_execute_insert(connector: MySQLConnector, config: MySQLConfig):
 @pytest.mark.integration
 def test_execute_update(connector: MySQLConnector, config: MySQLConfig):
     """Test UPDATE operation."""
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"test_update_{suffix}"
 
     connector.switch_context(database_name=config.database)
@@ -339,7 +347,7 @@ def test_execute_update(connector: MySQLConnector, config: MySQLConfig):
 @pytest.mark.integration
 def test_execute_delete(connector: MySQLConnector, config: MySQLConfig):
     """Test DELETE operation."""
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"test_delete_{suffix}"
 
     connector.switch_context(database_name=config.database)
@@ -381,7 +389,7 @@ def test_exception_on_syntax_error(connector: MySQLConnector):
 @pytest.mark.integration
 def test_exception_on_nonexistent_table(connector: MySQLConnector):
     """Test that non-existent table returns error result."""
-    result = connector.execute({"sql_query": f"SELECT * FROM nonexistent_table_{uuid.uuid4().hex}"})
+    result = connector.execute({"sql_query": f"SELECT * FROM nonexistent_table_{secrets.token_hex(16)}"})
     assert result.error is not None or not result.success
 
 
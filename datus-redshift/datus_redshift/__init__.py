@@ -6,9 +6,6 @@ to Amazon Redshift databases and perform queries, metadata retrieval, and
 other database operations.
 """
 
-# Import the connector registry from Datus to register our connector
-from datus.tools.db_tools import connector_registry
-
 # Import our configuration and connector classes
 from .config import RedshiftConfig
 from .connector import RedshiftConnector
@@ -19,6 +16,9 @@ __version__ = "0.1.0"
 # Export these classes so they can be imported with: from datus_redshift import RedshiftConnector, RedshiftConfig
 __all__ = ["RedshiftConnector", "RedshiftConfig", "register"]
 
+# Tracks whether register() has already run, so repeated calls are free
+_registered = False
+
 
 def register():
     """
@@ -27,12 +27,24 @@ def register():
     This function registers the RedshiftConnector class with the Datus connector
     registry under the name "redshift". This allows Datus to automatically discover
     and use this connector when configured to connect to Redshift databases.
+
+    The registry import happens lazily inside this function and registration
+    runs at most once, so importing this package stays cheap and calling
+    register() repeatedly is a no-op.
     """
+    global _registered
+    if _registered:
+        return
+
+    # Import the connector registry from Datus only when actually registering
+    from datus.tools.db_tools import connector_registry
+
     # Register our connector with the name "redshift"
     # Now users can specify dialect="redshift" in their Datus configuration
     connector_registry.register("redshift", RedshiftConnector)
+    _registered = True
 
 
-# Auto-register when this module is imported
-# This means the connector is automatically available when you install this package
-register()
+# Registration happens through the "datus.adapters" entry point declared in
+# pyproject.toml (like the other adapters in this workspace), so importing
+# this package does not eagerly load the Datus registry.
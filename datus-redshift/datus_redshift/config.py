@@ -14,7 +14,9 @@ class RedshiftConfig(BaseModel):
     # ConfigDict settings:
     # - extra="forbid": Prevents additional fields not defined in the model
     # - populate_by_name=True: Allows using field aliases (like 'schema' for 'schema_name')
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    # - frozen=True: Makes instances immutable (and hashable), so a config can be
+    #   shared between connectors or used as a cache/pool key without defensive copies
+    model_config = ConfigDict(extra="forbid", populate_by_name=True, frozen=True)
 
     # Required fields (must be provided when creating a RedshiftConfig instance)
 
@@ -3,7 +3,10 @@
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 
 # Standard library imports
+import hashlib
 import re
+import socket
+import threading
 
 # Import type hints for better code documentation and IDE support
 from typing import Any, Dict, List, Literal, Optional, Sequence, Set, Union, override
@@ -43,6 +46,123 @@ from .config import RedshiftConfig
 # Get a logger instance for this module (for debugging and error messages)
 logger = get_logger(__name__)
 
+# Module-level pool of idle connections shared by all RedshiftConnector
+# instances, keyed by the full set of connection parameters (with secrets
+# hashed). Opening a Redshift connection pays a TCP + TLS + auth handshake
+# (~50-200 ms), so closed connectors park their connection here for the
+# next connector with the same parameters instead of tearing it down.
+_POOL_LOCK = threading.Lock()
+_POOL_MAX_IDLE = 16
+
+# Rows fetched per batch when building Arrow results incrementally
+_ARROW_BATCH_ROWS = 10_000
+
+# Valid Redshift identifier: starts with a letter or underscore, then any
+# combination of alphanumerics, underscores, or dollar signs. Compiled once
+# since identifier validation runs on every full_name/metadata call.
+_IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_$]*$")
+_connection_pool: Dict[tuple, List[Any]] = {}
+
+
+def _pool_key(connection_params: Dict[str, Any]) -> tuple:
+    """
+    Build the pool key identifying a connection target.
+
+    The key covers every connection parameter — credentials, SSL, timeout,
+    and IAM settings included — so a connector configured differently for
+    the same host never reuses a session authenticated under other values
+    (e.g. a wrong password must fail instead of riding a pooled session).
+    Secrets go into the key as SHA-256 digests rather than plaintext.
+    """
+    key_params = dict(connection_params)
+    for secret_field in ("password", "secret_access_key"):
+        secret = key_params.pop(secret_field, None)
+        if secret is not None:
+            key_params[secret_field] = hashlib.sha256(str(secret).encode("utf-8")).hexdigest()
+    return tuple(sorted(key_params.items()))
+
+
+def _acquire_connection(connection_params: Dict[str, Any]) -> tuple:
+    """
+    Get a connection for the given parameters, reusing a pooled one if possible.
+
+    Pooled connections are ping-tested before reuse (mirroring the
+    pool_pre_ping behavior of the SQLAlchemy-based adapters); stale ones
+    are discarded and replaced by a fresh connection.
+
+    Args:
+        connection_params: Keyword arguments for redshift_connector.connect
+
+    Returns:
+        Tuple of (open connection, pool key)
+    """
+    key = _pool_key(connection_params)
+    while True:
+        with _POOL_LOCK:
+            idle = _connection_pool.get(key)
+            connection = idle.pop() if idle else None
+
+        if connection is None:
+            # Nothing pooled: open a fresh connection
+            connection = redshift_connector.connect(**connection_params)
+            _tune_connection_socket(connection)
+            return connection, key
+
+        # Verify the pooled connection is still alive before handing it out
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            connection.rollback()
+            return connection, key
+        except Exception as e:
+            logger.debug(f"Discarding stale pooled Redshift connection: {e}")
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+
+def _release_connection(key: tuple, connection) -> None:
+    """
+    Return a connection to the pool, or close it if the pool is full.
+
+    The connection is rolled back and its session state reset first so
+    neither an open transaction nor session settings leak to the next
+    user; connections that fail this cleanup are closed instead of being
+    pooled.
+
+    Args:
+        key: Pool key the connection was acquired under
+        connection: The connection to return
+    """
+    try:
+        connection.rollback()
+        # SET search_path (issued by do_switch_context) survives rollback,
+        # so reset it explicitly: the next connector drawing this connection
+        # must see the same fresh session a brand-new connection would give
+        with connection.cursor() as cursor:
+            cursor.execute("RESET search_path")
+        connection.commit()
+    except Exception:
+        try:
+            connection.close()
+        except Exception:
+            pass
+        return
+
+    with _POOL_LOCK:
+        idle = _connection_pool.setdefault(key, [])
+        if len(idle) < _POOL_MAX_IDLE:
+            idle.append(connection)
+            return
+
+    # Pool for this target is full; actually close the connection
+    try:
+        connection.close()
+    except Exception:
+        pass
+
 
 def _handle_redshift_exception(e: Exception, sql: str = "") -> DatusException:
     """
@@ -84,6 +204,48 @@ def _handle_redshift_exception(e: Exception, sql: str = "") -> DatusException:
         return DatusException(ErrorCode.DB_FAILED, message_args={"error_message": str(e)})
 
 
+def _tune_connection_socket(connection) -> None:
+    """
+    Tune the raw TCP socket underlying a redshift_connector connection.
+
+    Enables TCP_NODELAY so small request/response roundtrips (metadata
+    queries, short DDL/INSERT statements) are not delayed by Nagle's
+    algorithm, which can add up to ~40 ms per sub-MTU write. Also enables
+    TCP keepalive with short probe timings (where the platform exposes
+    them) so pooled connections that sit idle are kept open through NAT /
+    load-balancer idle timeouts and dead peers are detected promptly
+    instead of hanging a later query. Send/receive buffer sizes are left
+    to OS autotuning on purpose, since fixing SO_SNDBUF/SO_RCVBUF disables
+    it.
+
+    The raw socket is a private attribute of redshift_connector's
+    Connection, so failures here are logged and ignored rather than
+    breaking the connection.
+
+    Args:
+        connection: An open redshift_connector connection
+    """
+    try:
+        sock = getattr(connection, "_usock", None)
+        if isinstance(sock, socket.socket):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+            # Probe timings are platform-specific (Linux/macOS expose them
+            # under different names, Windows not at all), so guard each one
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                # Start probing after 60s of idleness
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                # Probe every 10s once probing starts
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+            if hasattr(socket, "TCP_KEEPCNT"):
+                # Declare the peer dead after 6 failed probes
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 6)
+    except OSError as e:
+        logger.debug(f"Could not tune Redshift connection socket: {e}")
+
+
 def _validate_sql_identifier(identifier: str, identifier_type: str = "identifier") -> None:
     """
     Validate SQL identifier to prevent SQL injection.
@@ -112,8 +274,7 @@ def _validate_sql_identifier(identifier: str, identifier_type: str = "identifier
         )
 
     # Check for valid characters: letters, digits, underscore, dollar sign
-    # Pattern: Must start with letter or underscore, then any combination of alphanumeric, underscore, or dollar
-    if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_$]*$", identifier):
+    if not _IDENTIFIER_PATTERN.match(identifier):
         raise ValueError(
             f"Invalid {identifier_type} name: '{identifier}'. "
             f"Must start with a letter or underscore and contain only "
@@ -186,13 +347,22 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
                 }
             )
 
-        # Establish the connection to Redshift
-        self.connection = redshift_connector.connect(**connection_params)
+        # Establish the connection to Redshift (reusing a pooled one if available)
+        self.connection, self._pool_key = _acquire_connection(connection_params)
 
         # Store current context (database and schema)
         self.database_name = config.database or "dev"
         self.schema_name = config.schema_name or "public"
 
+        # Cache for database/schema listings so repeated metadata lookups
+        # (autocomplete, schema indexing) don't re-query the catalog.
+        # Invalidated whenever a DDL statement or context switch runs.
+        self._metadata_cache: Dict[tuple, List[str]] = {}
+
+    def _invalidate_metadata_cache(self):
+        """Drop cached database/schema listings after DDL or context changes."""
+        self._metadata_cache.clear()
+
     def test_connection(self) -> Dict[str, Any]:
         """
         Test the database connection by executing a simple query.
@@ -201,10 +371,11 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
             Dictionary with success status and message
         """
         try:
-            # Execute a simple query to verify connection works
+            # Execute a simple query to verify connection works; fetch a
+            # single row since the probe result itself is irrelevant
             with self.connection.cursor() as cursor:
                 cursor.execute("SELECT 1")
-                cursor.fetchall()
+                cursor.fetchone()
             return {
                 "success": True,
                 "message": "Connection successful",
@@ -215,9 +386,29 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
             raise _handle_redshift_exception(e, "SELECT 1")
 
     def close(self):
-        """Close the database connection and free resources."""
+        """Return the connection to the shared pool for reuse."""
         if self.connection:
-            self.connection.close()
+            _release_connection(self._pool_key, self.connection)
+            self.connection = None
+
+    @classmethod
+    def shutdown_pool(cls):
+        """
+        Close all idle pooled connections.
+
+        Call this at application/test-session teardown when no further
+        Redshift connectors will be created.
+        """
+        with _POOL_LOCK:
+            idle_lists = list(_connection_pool.values())
+            _connection_pool.clear()
+
+        for connections in idle_lists:
+            for connection in connections:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
 
     def get_type(self) -> str:
         """
@@ -287,6 +478,9 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
                         f"Cannot switch database from {self.database_name} to {database_name} "
                         f"in existing connection. Create a new connection to change databases."
                     )
+
+            # Context changed; cached listings may no longer apply
+            self._invalidate_metadata_cache()
         except ValueError as e:
             # Re-raise validation errors as-is
             raise e
@@ -337,28 +531,63 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
                 else:
                     cursor.execute(sql_query)
 
-                # Fetch all results
-                results = cursor.fetchall()
-
                 # Get column names from cursor description
                 column_names = [desc[0] for desc in cursor.description] if cursor.description else []
+                if not column_names:
+                    # No result columns (e.g. statements without output)
+                    return pa.table([]), 0
 
-                # Convert results to Arrow table
-                if results and column_names:
-                    # Transpose rows to columns for Arrow
-                    columns = list(zip(*results)) if results else [[] for _ in column_names]
-
-                    # Create Arrow arrays for each column
-                    arrow_arrays = [pa.array(col) for col in columns]
+                # Stream the result set in fixed-size batches instead of
+                # materializing every row as Python objects at once: each
+                # batch is transposed, converted to Arrow, and its row
+                # objects freed before the next batch is fetched, bounding
+                # peak memory on large SELECTs.
+                batches = []
+                schema = None
+                while True:
+                    rows = cursor.fetchmany(_ARROW_BATCH_ROWS)
+                    if not rows:
+                        break
+
+                    columns = list(zip(*rows))
+                    if schema is None:
+                        batch = pa.Table.from_arrays([pa.array(col) for col in columns], names=column_names)
+                        schema = batch.schema
+                    else:
+                        try:
+                            # Reuse the schema inferred from the first batch
+                            # so all batches can be concatenated directly
+                            arrays = [pa.array(col, type=schema.field(i).type) for i, col in enumerate(columns)]
+                            batch = pa.Table.from_arrays(arrays, schema=schema)
+                        except (pa.ArrowInvalid, pa.ArrowTypeError):
+                            # First-batch inference was too narrow (e.g. a
+                            # leading all-NULL column); fall back to fresh
+                            # inference and let concat promote types below
+                            batch = pa.Table.from_arrays([pa.array(col) for col in columns], names=column_names)
+                    batches.append(batch)
+
+                # Return empty table if no results
+                if not batches:
+                    return pa.table([]), 0
 
-                    # Create Arrow table
-                    arrow_table = pa.Table.from_arrays(arrow_arrays, names=column_names)
-                    return arrow_table, len(results)
+                if len(batches) == 1:
+                    arrow_table = batches[0]
                 else:
-                    # Return empty table if no results
-                    return pa.table([]), 0
+                    try:
+                        arrow_table = pa.concat_tables(batches)
+                    except pa.ArrowInvalid:
+                        # Batches ended up with different schemas; promote
+                        arrow_table = pa.concat_tables(batches, promote_options="permissive")
+                return arrow_table, arrow_table.num_rows
 
         except Exception as e:
+            # redshift_connector is not autocommit: without a rollback the
+            # failed query leaves the open transaction aborted and every
+            # later query on this connection fails too
+            try:
+                self.connection.rollback()
+            except Exception:
+                pass
             raise _handle_redshift_exception(e, sql_query)
 
     def execute_query_to_df(
@@ -401,29 +630,11 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         Returns:
             List of dictionaries, one per row
         """
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(sql)
-                results = cursor.fetchall()
-
-                # If no results, return empty list
-                if not results:
-                    return []
-
-                # Get column names
-                column_names = [desc[0] for desc in cursor.description]
-
-                # Convert each row to dictionary
-                result = []
-                for row in results:
-                    row_dict = {}
-                    for i, col_name in enumerate(column_names):
-                        row_dict[col_name] = row[i]
-                    result.append(row_dict)
-
-                return result
-        except Exception as e:
-            raise _handle_redshift_exception(e, sql)
+        # Keep the data columnar as long as possible: build the Arrow table
+        # first and let Arrow materialize the row dicts in C instead of
+        # assembling each row dict in a Python loop
+        arrow_table, _ = self._do_execute_arrow(sql)
+        return arrow_table.to_pylist()
 
     @override
     def execute_ddl(self, sql: str) -> ExecuteSQLResult:
@@ -524,6 +735,9 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
                 # Get number of rows affected
                 rowcount = cursor.rowcount if cursor.rowcount else 0
 
+                # DDL may have created/dropped databases or schemas
+                self._invalidate_metadata_cache()
+
                 return ExecuteSQLResult(
                     sql_query=sql,
                     row_count=rowcount,
@@ -566,6 +780,9 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
                 if schema_name := switch_context.get("schema_name"):
                     self.schema_name = schema_name
 
+            # Context changed; cached listings may no longer apply
+            self._invalidate_metadata_cache()
+
             return ExecuteSQLResult(
                 success=True,
                 sql_query=sql_query,
@@ -715,6 +932,11 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         Returns:
             List of database names
         """
+        # Serve repeated listings from the cache
+        cache_key = ("databases", include_sys)
+        if cache_key in self._metadata_cache:
+            return list(self._metadata_cache[cache_key])
+
         # Query system catalog to get database list
         sql = "SELECT datname FROM pg_database WHERE datistemplate = false"
 
@@ -730,6 +952,7 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
                     if include_sys or db_name not in self._sys_databases():
                         databases.append(db_name)
 
+            self._metadata_cache[cache_key] = list(databases)
             return databases
         except Exception as e:
             raise _handle_redshift_exception(e, sql)
@@ -747,6 +970,11 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         Returns:
             List of schema names
         """
+        # Serve repeated listings from the cache
+        cache_key = ("schemas", include_sys)
+        if cache_key in self._metadata_cache:
+            return list(self._metadata_cache[cache_key])
+
         # Query system catalog to get schema list
         sql = """
             SELECT nspname
@@ -767,6 +995,7 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
                     if include_sys or schema_name not in self._sys_schemas():
                         schemas.append(schema_name)
 
+            self._metadata_cache[cache_key] = list(schemas)
             return schemas
         except Exception as e:
             raise _handle_redshift_exception(e, sql)
@@ -1107,6 +1336,85 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
             logger.warning(f"Failed to get DDL for {object_type} {schema_name}.{table_name}: {e}")
             return f"-- DDL not available for {object_type.lower()} {schema_name}.{table_name}: {e}"
 
+    def _fetch_view_ddl_map(self, entries: List[Dict[str, str]], materialized: bool = False) -> Dict[tuple, str]:
+        """
+        Fetch DDL for many views with a single catalog query.
+
+        Issuing one pg_get_viewdef call per view costs one network
+        roundtrip each; this batches all of them into a single query
+        against pg_class, so N views cost one roundtrip.
+
+        Args:
+            entries: View metadata entries from _get_tables_per_schema
+            materialized: Whether the entries are materialized views
+
+        Returns:
+            Dict mapping (schema_name, table_name) to the DDL statement
+        """
+        if not entries:
+            return {}
+
+        schemas = sorted({entry["schema_name"] for entry in entries})
+        names = sorted({entry["table_name"] for entry in entries})
+
+        # Validate identifiers to prevent SQL injection
+        for schema in schemas:
+            _validate_sql_identifier(schema, "schema")
+        for name in names:
+            _validate_sql_identifier(name, "view")
+
+        schema_list = ", ".join(f"'{schema}'" for schema in schemas)
+        name_list = ", ".join(f"'{name}'" for name in names)
+
+        # relkind 'v' = view, 'm' = materialized view
+        relkind = "m" if materialized else "v"
+        sql = f"""
+            SELECT n.nspname, c.relname, pg_get_viewdef(c.oid, true)
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE c.relkind = '{relkind}'
+            AND n.nspname IN ({schema_list})
+            AND c.relname IN ({name_list})
+        """
+
+        mat_view = "MATERIALIZED " if materialized else ""
+        ddl_map = {}
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql)
+            for row in cursor.fetchall():
+                ddl_map[(row[0], row[1])] = f"CREATE {mat_view}VIEW {row[0]}.{row[1]} AS\n{row[2]}"
+
+        return ddl_map
+
+    def _attach_view_ddl(self, entries: List[Dict[str, str]], object_type: str) -> List[Dict[str, str]]:
+        """
+        Attach DDL definitions to view metadata entries.
+
+        Tries the batched single-query path first and only falls back to
+        one pg_get_viewdef roundtrip per entry if the batch query fails.
+
+        Args:
+            entries: View metadata entries
+            object_type: "VIEW" or "MATERIALIZED VIEW"
+
+        Returns:
+            The entries with a "definition" key added to each
+        """
+        materialized = object_type.upper() == "MATERIALIZED VIEW"
+        try:
+            ddl_map = self._fetch_view_ddl_map(entries, materialized=materialized)
+        except Exception as e:
+            logger.warning(f"Batched DDL fetch failed, falling back to per-object queries: {e}")
+            ddl_map = {}
+
+        for entry in entries:
+            ddl = ddl_map.get((entry["schema_name"], entry["table_name"]))
+            if ddl is None:
+                ddl = self._fetch_object_ddl(object_type, entry["schema_name"], entry["table_name"])
+            entry["definition"] = ddl
+
+        return entries
+
     @override
     def get_tables_with_ddl(
         self,
@@ -1168,11 +1476,8 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         if not view_entries:
             return []
 
-        # Add DDL to each entry
-        for entry in view_entries:
-            entry["definition"] = self._fetch_object_ddl("VIEW", entry["schema_name"], entry["table_name"])
-
-        return view_entries
+        # Add DDL to each entry with a single batched catalog query
+        return self._attach_view_ddl(view_entries, "VIEW")
 
     def get_materialized_views_with_ddl(
         self, catalog_name: str = "", database_name: str = "", schema_name: str = ""
@@ -1198,11 +1503,8 @@ class RedshiftConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedView
         if not mv_entries:
             return []
 
-        # Add DDL to each entry
-        for entry in mv_entries:
-            entry["definition"] = self._fetch_object_ddl("MATERIALIZED VIEW", entry["schema_name"], entry["table_name"])
-
-        return mv_entries
+        # Add DDL to each entry with a single batched catalog query
+        return self._attach_view_ddl(mv_entries, "MATERIALIZED VIEW")
 
     @override
     def get_sample_rows(
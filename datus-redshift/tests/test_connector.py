@@ -25,13 +25,15 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def redshift_config():
     """
     Create a Redshift configuration from environment variables.
 
     This fixture reads connection details from environment variables
     and creates a RedshiftConfig object for testing.
+
+    Session-scoped so the config is built once for the whole test run.
     """
     return RedshiftConfig(
         host=os.getenv("REDSHIFT_HOST"),
@@ -45,13 +47,14 @@ def redshift_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def connector(redshift_config):
     """
     Create a RedshiftConnector instance for testing.
 
-    This fixture creates a connector and ensures it's properly closed
-    after the test completes.
+    Session-scoped so all tests share a single connection instead of
+    paying the TCP + TLS + auth handshake once per test. Tests that need
+    a specific context should call connector.switch_context explicitly.
     """
     # Create connector instance
     conn = RedshiftConnector(redshift_config)
@@ -2,6 +2,7 @@
 # Licensed under the Apache License, Version 2.0.
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 
+from functools import lru_cache
 from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, override
 
 from datus.schemas.base import TABLE_TYPE
@@ -33,6 +34,19 @@ from sqlalchemy.exc import (
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _cached_text(sql: str):
+    """
+    Build a TextClause, caching it for repeated statements.
+
+    Statements such as connection tests and fixture DDL are executed many
+    times with identical SQL; caching the construct skips re-parsing it on
+    every call. TextClause objects are immutable once built, so sharing
+    them across executions (and threads) is safe.
+    """
+    return text(sql)
+
+
 class SQLAlchemyConnector(BaseSqlConnector):
     """
     Base SQLAlchemy connector for database adapters.
@@ -218,17 +232,20 @@ class SQLAlchemyConnector(BaseSqlConnector):
         """Execute SELECT query."""
         try:
             self.connect()
-            result = self._execute_query(sql)
-            row_count = len(result)
+            rows, keys = self._execute_rows(sql)
+            row_count = len(rows)
 
-            # Format result based on requested format
+            # Format result based on requested format. Tabular formats are
+            # built directly from the driver rows; only "list" pays for a
+            # dict per row.
             if result_format == "csv":
-                df = DataFrame(result)
-                result = df.to_csv(index=False)
+                result = DataFrame(rows, columns=keys).to_csv(index=False)
             elif result_format == "arrow":
-                result = Table.from_pylist(result)
+                result = Table.from_pandas(DataFrame(rows, columns=keys), preserve_index=False)
             elif result_format == "pandas":
-                result = DataFrame(result)
+                result = DataFrame(rows, columns=keys)
+            else:
+                result = [row._asdict() for row in rows]
 
             return ExecuteSQLResult(
                 success=True, sql_query=sql, sql_return=result, row_count=row_count, result_format=result_format
@@ -237,8 +254,8 @@ class SQLAlchemyConnector(BaseSqlConnector):
             ex = e if isinstance(e, DatusException) else self._handle_exception(e, sql)
             return ExecuteSQLResult(success=False, error=str(ex), sql_query=sql)
 
-    def _execute_query(self, sql: str) -> List[Dict[str, Any]]:
-        """Internal query execution returning list of dicts."""
+    def _execute_rows(self, sql: str) -> Tuple[List[Any], List[str]]:
+        """Internal query execution returning raw driver rows and column names."""
         if parse_sql_type(sql, self.dialect) in (
             SQLType.INSERT,
             SQLType.UPDATE,
@@ -253,21 +270,25 @@ class SQLAlchemyConnector(BaseSqlConnector):
         try:
             # Get connection from pool for this query
             with self.engine.connect() as conn:
-                result = conn.execute(text(sql))
-                rows = result.fetchall()
-                return [row._asdict() for row in rows]
+                result = conn.execute(_cached_text(sql))
+                return result.fetchall(), list(result.keys())
         except DatusException:
             raise
         except Exception as e:
             raise self._handle_exception(e, sql, "query") from e
 
+    def _execute_query(self, sql: str) -> List[Dict[str, Any]]:
+        """Internal query execution returning list of dicts."""
+        rows, _ = self._execute_rows(sql)
+        return [row._asdict() for row in rows]
+
     @override
     def execute_insert(self, sql: str) -> ExecuteSQLResult:
         """Execute INSERT statement."""
         try:
             self.connect()
             with self.engine.connect() as conn:
-                res = conn.execute(text(sql))
+                res = conn.execute(_cached_text(sql))
                 conn.commit()
 
                 # Get inserted primary key or row count
@@ -294,7 +315,7 @@ class SQLAlchemyConnector(BaseSqlConnector):
         try:
             self.connect()
             with self.engine.connect() as conn:
-                res = conn.execute(text(sql))
+                res = conn.execute(_cached_text(sql))
                 conn.commit()
                 return ExecuteSQLResult(
                     success=True, sql_query=sql, sql_return=str(res.rowcount), row_count=res.rowcount
@@ -309,7 +330,7 @@ class SQLAlchemyConnector(BaseSqlConnector):
         try:
             self.connect()
             with self.engine.connect() as conn:
-                res = conn.execute(text(sql))
+                res = conn.execute(_cached_text(sql))
                 conn.commit()
                 return ExecuteSQLResult(
                     success=True, sql_query=sql, sql_return=str(res.rowcount), row_count=res.rowcount
@@ -324,7 +345,7 @@ class SQLAlchemyConnector(BaseSqlConnector):
         try:
             self.connect()
             with self.engine.connect() as conn:
-                res = conn.execute(text(sql))
+                res = conn.execute(_cached_text(sql))
                 conn.commit()
                 return ExecuteSQLResult(
                     success=True, sql_query=sql, sql_return=str(res.rowcount), row_count=res.rowcount
@@ -346,7 +367,8 @@ class SQLAlchemyConnector(BaseSqlConnector):
 
     def _execute_pandas(self, sql: str) -> DataFrame:
         """Internal pandas execution."""
-        return DataFrame(self._execute_query(sql))
+        rows, keys = self._execute_rows(sql)
+        return DataFrame(rows, columns=keys)
 
     def execute_csv(self, sql: str) -> ExecuteSQLResult:
         """Execute query and return CSV format."""
@@ -366,7 +388,7 @@ class SQLAlchemyConnector(BaseSqlConnector):
         """Execute query and return Arrow table."""
         try:
             self.connect()
-            result = self.connection.execute(text(sql))
+            result = self.connection.execute(_cached_text(sql))
             if result.returns_rows:
                 df = DataFrame(result.fetchall(), columns=result.keys())
                 table = Table.from_pandas(df)
@@ -388,7 +410,7 @@ class SQLAlchemyConnector(BaseSqlConnector):
         self.connect()
         try:
             with self.engine.connect() as conn:
-                conn.execute(text(sql))
+                conn.execute(_cached_text(sql))
                 conn.commit()
 
             # Update context if applicable
@@ -414,7 +436,7 @@ class SQLAlchemyConnector(BaseSqlConnector):
         try:
             with self.engine.connect() as conn:
                 for query in queries:
-                    result = conn.execute(text(query))
+                    result = conn.execute(_cached_text(query))
                     if result.returns_rows:
                         df = DataFrame(result.fetchall(), columns=list(result.keys()))
                         results.append(df.to_dict(orient="records"))
@@ -601,7 +623,7 @@ class SQLAlchemyConnector(BaseSqlConnector):
         self.connect()
         try:
             with self.engine.connect() as conn:
-                result = conn.execute(text(sql).execution_options(stream_results=True, max_row_buffer=max_rows))
+                result = conn.execute(_cached_text(sql).execution_options(stream_results=True, max_row_buffer=max_rows))
                 if result.returns_rows:
                     if with_header:
                         yield result.keys()
@@ -2,7 +2,7 @@
 # Licensed under the Apache License, Version 2.0.
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 
-from typing import Any, Dict, List, Set, Union, override
+from typing import Any, Dict, List, Optional, Set, Union, override
 
 from datus.tools.db_tools.base import list_to_in_str
 from datus.tools.db_tools.mixins import CatalogSupportMixin, MaterializedViewSupportMixin
@@ -114,6 +114,7 @@ class StarRocksConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSu
         table_type: str = "table",
         catalog_name: str = "",
         database_name: str = "",
+        tables: Optional[List[str]] = None,
     ) -> List[Dict[str, str]]:
         """
         Get metadata for tables/views with catalog support.
@@ -122,6 +123,7 @@ class StarRocksConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSu
             table_type: Type of object (table, view, mv)
             catalog_name: Catalog name
             database_name: Database name to query
+            tables: Optional list of table names to restrict the query to
 
         Returns:
             List of metadata dictionaries with catalog_name properly set
@@ -133,7 +135,7 @@ class StarRocksConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSu
         self._before_metadata_query(catalog_name=current_catalog, database_name=database_name)
 
         # Get base metadata from parent
-        result = super()._get_metadata(table_type, catalog_name, database_name)
+        result = super()._get_metadata(table_type, catalog_name, database_name, tables=tables)
 
         # Set the correct catalog_name and filter results by catalog as safety check
         filtered_result = []
@@ -210,20 +212,21 @@ class StarRocksConnector(MySQLConnector, CatalogSupportMixin, MaterializedViewSu
 
         result = self._execute_pandas(query_sql)
 
+        # itertuples avoids a pandas scalar lookup per cell
         mv_list = []
-        for i in range(len(result)):
+        for row in result.itertuples(index=False):
             mv_list.append(
                 {
                     "identifier": self.identifier(
                         catalog_name=current_catalog,
-                        database_name=str(result["TABLE_SCHEMA"][i]),
-                        table_name=str(result["TABLE_NAME"][i]),
+                        database_name=str(row.TABLE_SCHEMA),
+                        table_name=str(row.TABLE_NAME),
                     ),
                     "catalog_name": current_catalog,
-                    "database_name": result["TABLE_SCHEMA"][i],
+                    "database_name": row.TABLE_SCHEMA,
                     "schema_name": "",
-                    "table_name": result["TABLE_NAME"][i],
-                    "definition": result["MATERIALIZED_VIEW_DEFINITION"][i],
+                    "table_name": row.TABLE_NAME,
+                    "definition": row.MATERIALIZED_VIEW_DEFINITION,
                     "table_type": "mv",
                 }
             )
@@ -2,7 +2,7 @@
 # Licensed under the Apache License, Version 2.0.
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 
-import uuid
+import secrets
 
 import pytest
 from datus_starrocks import StarRocksConfig, StarRocksConnector
@@ -46,7 +46,7 @@ def test_execute_explain_query(connector: StarRocksConnector, config: StarRocksC
 @pytest.mark.acceptance
 def test_execute_ddl_create_drop(connector: StarRocksConnector, config: StarRocksConfig):
     """Test DDL operations (CREATE/DROP table)."""
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"datus_test_{suffix}"
 
     connector.switch_context(database_name=config.database)
@@ -73,7 +73,7 @@ def test_execute_ddl_create_drop(connector: StarRocksConnector, config: StarRock
 @pytest.mark.integration
 def test_execute_ddl_create_materialized_view(connector: StarRocksConnector, config: StarRocksConfig):
     """Test creating materialized view (if supported)."""
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"datus_base_{suffix}"
     mv_name = f"datus_mv_{suffix}"
 
@@ -126,7 +126,7 @@ def test_execute_ddl_create_materialized_view(connector: StarRocksConnector, con
 @pytest.mark.acceptance
 def test_execute_insert(connector: StarRocksConnector, config: StarRocksConfig):
     """Test INSERT operation."""
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"datus_insert_test_{suffix}"
 
     connector.switch_context(database_name=config.database)
@@ -165,7 +165,7 @@ def test_execute_insert(connector: StarRocksConnector, config: StarRocksConfig):
 @pytest.mark.integration
 def test_execute_update(connector: StarRocksConnector, config: StarRocksConfig):
     """Test UPDATE operation."""
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"datus_update_test_{suffix}"
 
     connector.switch_context(database_name=config.database)
@@ -208,7 +208,7 @@ def test_execute_update(connector: StarRocksConnector, config: StarRocksConfig):
 @pytest.mark.integration
 def test_execute_delete(connector: StarRocksConnector, config: StarRocksConfig):
     """Test DELETE operation."""
-    suffix = uuid.uuid4().hex[:8]
+    suffix = secrets.token_hex(4)
     table_name = f"datus_delete_test_{suffix}"
 
     connector.switch_context(database_name=config.database)